@@ -4,6 +4,8 @@ main.py
 - It simply creates the UI app and starts Tkinter's event loop.
 """
 
+import multiprocessing
+
 from ui_app import StorageScannerApp
 
 
@@ -20,4 +22,7 @@ def main():
 # This check ensures main() only runs when YOU run `python main.py`
 # and not when the file is imported by other modules.
 if __name__ == "__main__":
+    # Needed in the PyInstaller exe: the scan process starts by re-running this
+    # executable, and this makes that copy run the scan instead of a second window
+    multiprocessing.freeze_support()
     main()
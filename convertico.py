@@ -7,11 +7,26 @@ images_dir = Path(__file__).parent / "images"
 # Open PNG from images folder
 img = Image.open(images_dir / "appicon.png")
 
-# Save ICO back into images folder
-img.save(
+# Icon sizes, largest first (ICO can't hold anything bigger than the source)
+sizes = [(256,256), (128,128), (64,64), (48,48), (32,32), (16,16)]
+sizes = [s for s in sizes if s[0] <= img.width and s[1] <= img.height]
+if not sizes:
+    raise SystemExit(f"appicon.png is {img.width}x{img.height}; it must be at least 16x16 to build an icon.")
+
+# Downsample step by step, each size from the previous one,
+# instead of resizing the full-resolution source once per size
+resized = []
+current = img
+for size in sizes:
+    current = current.resize(size, Image.LANCZOS)  # type: ignore
+    resized.append(current)
+
+# Save ICO back into images folder (PIL uses the pre-resized frames as-is)
+resized[0].save(
     images_dir / "appicon.ico",
     format="ICO",
-    sizes=[(16,16), (32,32), (48,48), (64,64), (128,128), (256,256)]
+    sizes=sizes,
+    append_images=resized[1:]
 )
 
 print("Icon created successfully.")
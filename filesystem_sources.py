@@ -8,24 +8,74 @@ This solves the "Desktop has nothing / doesn't scan" issue on many Windows PCs.
 """
 
 import os
+import sys
+import threading
+import time
 import psutil
 
 
+# How long to wait for a drive to answer os.path.exists (disconnected network
+# drives can otherwise hang startup for seconds)
+PROBE_TIMEOUT_SECONDS = 0.5
+
+
 def _add_if_exists(roots: list, path: str):
     """Helper: add a path if it exists and isn't already in the list."""
     if path and os.path.exists(path) and path not in roots:
         roots.append(path)
 
 
+def _probe_exists(paths: list, timeout: float = PROBE_TIMEOUT_SECONDS) -> set:
+    """
+    Helper: run os.path.exists for all paths in parallel and return the ones that exist.
+    A path that doesn't answer within `timeout` is treated as missing.
+    Daemon threads are used so a hung drive can't block the app from exiting.
+    """
+    found = set()
+
+    def probe(path):
+        if os.path.exists(path):
+            found.add(path)
+
+    threads = [threading.Thread(target=probe, args=(p,), daemon=True) for p in paths]
+    for t in threads:
+        t.start()
+
+    deadline = time.monotonic() + timeout
+    for t in threads:
+        t.join(max(0.0, deadline - time.monotonic()))
+
+    return set(found)
+
+
+def _get_drive_roots() -> list:
+    """Mountpoints worth offering, without probing drives that can't have media or always exist."""
+    drives = []
+    to_probe = []
+    for part in psutil.disk_partitions(all=False):
+        # Empty fstype = removable drive with no media inserted (e.g. empty card reader)
+        if not part.fstype:
+            continue
+        # Fixed local disks are always present on Windows, no need to probe
+        if sys.platform.startswith("win") and "fixed" in part.opts:
+            drives.append(part.mountpoint)
+            continue
+        drives.append(part.mountpoint)
+        to_probe.append(part.mountpoint)
+
+    reachable = _probe_exists(to_probe) if to_probe else set()
+    return [d for d in drives if d not in to_probe or d in reachable]
+
+
 def get_scan_roots():
     roots = []
 
     # ------------------------------------------------------------
     # 1) Drives / partitions (C:\, D:\, etc.)
     # ------------------------------------------------------------
-    for part in psutil.disk_partitions(all=False):
-        mountpoint = part.mountpoint
-        _add_if_exists(roots, mountpoint)
+    for mountpoint in _get_drive_roots():
+        if mountpoint not in roots:
+            roots.append(mountpoint)
 
     # ------------------------------------------------------------
     # 2) User profile folders (local)
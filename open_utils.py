@@ -11,11 +11,24 @@ macOS/Linux:
 - reveal_in_folder(path): opens the containing folder
 """
 
+import errno
 import os
 import sys
 import subprocess
 
 
+def _run_opener(cmd: list, path: str):
+    """
+    Run `open` / `xdg-open` and raise OSError if it failed (e.g. the path is gone),
+    so callers can report a stale entry without checking the path first.
+    """
+    result = subprocess.run(cmd + [path], check=False)
+    if result.returncode != 0:
+        if not os.path.exists(path):
+            raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), path)
+        raise OSError(f"{cmd[0]} exited with status {result.returncode}: {path}")
+
+
 def open_file(path: str):
     """Open a file with the OS default app."""
     path = os.path.abspath(path)
@@ -25,11 +38,11 @@ def open_file(path: str):
         return
 
     if sys.platform == "darwin":
-        subprocess.run(["open", path], check=False)
+        _run_opener(["open"], path)
         return
 
     # Linux / other
-    subprocess.run(["xdg-open", path], check=False)
+    _run_opener(["xdg-open"], path)
 
 
 def open_folder(path: str):
@@ -41,10 +54,10 @@ def open_folder(path: str):
         return
 
     if sys.platform == "darwin":
-        subprocess.run(["open", path], check=False)
+        _run_opener(["open"], path)
         return
 
-    subprocess.run(["xdg-open", path], check=False)
+    _run_opener(["xdg-open"], path)
 
 
 def reveal_in_folder(file_path: str):
@@ -52,8 +65,12 @@ def reveal_in_folder(file_path: str):
     Reveal a file in its folder.
     On Windows: selects the file in Explorer.
     Else: opens containing folder.
+    Raises FileNotFoundError if the file is gone (Explorer wouldn't report it,
+    it just opens its default folder instead).
     """
     file_path = os.path.abspath(file_path)
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), file_path)
 
     if sys.platform.startswith("win"):
         # Explorer select file
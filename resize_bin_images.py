@@ -0,0 +1,17 @@
+from PIL import Image
+from pathlib import Path
+
+# Build correct path to images folder
+images_dir = Path(__file__).parent / "images"
+
+# On-screen size of the recycle bin in ui_app.py (keep in sync with BIN_W, BIN_H there)
+BIN_W, BIN_H = 96, 172
+
+# Pre-resize the bin images once, so the app can load them directly with
+# tk.PhotoImage at startup instead of decoding + LANCZOS-resizing every launch
+for name in ["ClosedRecycleBin", "OpenRecycleBin"]:
+    img = Image.open(images_dir / f"{name}.png").convert("RGBA")
+    img = img.resize((BIN_W, BIN_H), Image.LANCZOS)  # type: ignore
+    img.save(images_dir / f"{name}_{BIN_W}x{BIN_H}.png", format="PNG", optimize=True)
+
+print("Recycle bin images created successfully.")
@@ -1,6 +1,9 @@
 """
 scanner_thread.py
-Threaded directory scanner using BFS (one directory at a time).
+Threaded directory scanner using DFS over a pool of worker threads.
+
+os.scandir/stat release the GIL while they wait on the filesystem, so several
+workers listing directories at once hide most of the per-directory I/O latency.
 
 Fix included:
 ✅ Allows directory symlinks/junctions (important for Documents/OneDrive redirects)
@@ -8,24 +11,55 @@ Fix included:
 """
 
 import os
-import threading
+import stat
+import heapq
 import queue
-from dataclasses import dataclass
-from typing import Callable, List, Tuple
+import threading
+import multiprocessing
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, FrozenSet, List, Optional, Tuple
 
 
 BYTES_IN_MB = 1024 * 1024
 BYTES_IN_GB = 1024 * 1024 * 1024
 
+# Directory names we never descend into: package caches / VCS / system folders
+# that hold huge numbers of tiny files nobody is looking for here.
+SKIP_DIRNAMES = frozenset({
+    "node_modules",
+    ".git",
+    "__pycache__",
+    "$Recycle.Bin",
+    "System Volume Information",
+    ".venv",
+    ".cache",
+})
+
+
+# (threshold, unit, 1/threshold), largest first.
+# The reciprocals are exact (powers of two), so multiplying matches dividing.
+_SIZE_UNITS = (
+    (BYTES_IN_GB, "GB", 1.0 / BYTES_IN_GB),
+    (BYTES_IN_MB, "MB", 1.0 / BYTES_IN_MB),
+)
+
 
 def format_size(num_bytes: int) -> str:
-    if num_bytes >= BYTES_IN_GB:
-        return f"{num_bytes / BYTES_IN_GB:.2f} GB"
-    if num_bytes >= BYTES_IN_MB:
-        return f"{num_bytes / BYTES_IN_MB:.2f} MB"
+    for threshold, unit, inv in _SIZE_UNITS:
+        if num_bytes >= threshold:
+            return f"{num_bytes * inv:.2f} {unit}"
     return f"{num_bytes} B"
 
 
+@lru_cache(maxsize=1024)
+def format_row(path: str, size: int) -> str:
+    """Display text for one result row (cached: the top lists barely change between updates)."""
+    return f"{format_size(size)}  |  {path}"
+
+
 @dataclass
 class ScanUpdate:
     current_dir: str
@@ -33,6 +67,106 @@ class ScanUpdate:
     scanned_files: int
     top_dirs: List[Tuple[str, int]]
     top_files: List[Tuple[str, int]]
+    # Ready-to-show row text for top_dirs / top_files (built on the scanner side,
+    # so the UI thread only hands strings to Tk)
+    top_dirs_display: List[str] = field(default_factory=list)
+    top_files_display: List[str] = field(default_factory=list)
+    # Snapshot order (taken under the scanner lock); higher = newer
+    seq: int = 0
+
+
+if os.name == "nt":
+    def _is_link(entry: os.DirEntry) -> bool:
+        # Junctions (e.g. redirected Documents) are reparse points but not symlinks.
+        # The lstat here is cached on the DirEntry, so this costs no syscall.
+        attrs = entry.stat(follow_symlinks=False).st_file_attributes
+        return bool(attrs & stat.FILE_ATTRIBUTE_REPARSE_POINT)
+else:
+    def _is_link(entry: os.DirEntry) -> bool:
+        return entry.is_symlink()
+
+
+def _scan_dir(
+    current_dir: str,
+    current_real: str,
+    subdirs: List[Tuple[str, Optional[str]]],
+    files: List[Tuple[int, str]],
+    stop_is_set: Callable[[], bool],
+    skip_dirnames: FrozenSet[str] = SKIP_DIRNAMES,
+) -> int:
+    """
+    List one directory (no locks held).
+    Appends (path, real_parent) of subdirectories to `subdirs` (except names in
+    `skip_dirnames`), (size, path) of regular files to `files`, and returns the
+    total size of the direct files.
+
+    real_parent is `current_real` for plain subdirectories, so their real path is
+    known without a realpath() call (which costs one lstat per path component).
+    It is None for symlinks/junctions, which still need resolving.
+
+    Kept as a plain function over str/int/list only (no self, no shared state),
+    so it can be compiled on its own (e.g. Cython pure-Python mode) if ever needed.
+    """
+    # Bind hot methods to locals once (saves a lookup per entry)
+    subdir_append = subdirs.append
+    file_append = files.append
+    dir_total = 0
+
+    try:
+        with os.scandir(current_dir) as it:
+            for entry in it:
+                if stop_is_set():
+                    break
+
+                # IMPORTANT CHANGE:
+                # We do NOT blanket-skip symlinks anymore,
+                # because Documents/OneDrive folders can be junctions.
+                # Instead we allow directories and rely on visited_realpaths to prevent loops.
+
+                # Queue subdirectories (including junctions)
+                try:
+                    if entry.is_dir(follow_symlinks=True):
+                        if entry.name not in skip_dirnames:
+                            subdir_append((entry.path, None if _is_link(entry) else current_real))
+                        continue
+                except Exception:
+                    continue
+
+                # Process files (follow_symlinks=False is fine)
+                # is_file() is answered by the directory listing itself (d_type on
+                # Linux/macOS, find data on Windows), so only regular files pay for
+                # an lstat - and on Windows that lstat is cached on the DirEntry too.
+                try:
+                    if entry.is_file(follow_symlinks=False):
+                        size = entry.stat(follow_symlinks=False).st_size
+                        dir_total += size
+                        file_append((size, entry.path))
+                except Exception:
+                    continue
+
+    except Exception:
+        # Permission denied / inaccessible
+        pass
+
+    return dir_total
+
+
+def _make_top_pusher(heap: List[Tuple[int, str]], max_results: int) -> Callable[[str, int], None]:
+    """
+    Build push(path, size) for one bounded min-heap.
+    The heap, K and heapq functions are closure locals, so the per-file call
+    does no self/module attribute lookups.
+    """
+    heappush = heapq.heappush
+    heapreplace = heapq.heapreplace
+
+    def push(path: str, size: int):
+        if len(heap) < max_results:
+            heappush(heap, (size, path))
+        elif size > heap[0][0]:
+            heapreplace(heap, (size, path))
+
+    return push
 
 
 class DirectoryScanner:
@@ -43,115 +177,295 @@ class DirectoryScanner:
         on_done: Callable[[str], None],
         max_results: int = 25,
         update_every_dirs: int = 25,
+        max_workers: Optional[int] = None,
+        skip_dirnames: FrozenSet[str] = SKIP_DIRNAMES,
     ):
         self.root = root
         self.on_update = on_update
         self.on_done = on_done
         self.max_results = max_results
         self.update_every_dirs = update_every_dirs
+        self.max_workers = max_workers or min(16, (os.cpu_count() or 4) * 2)
+        self.skip_dirnames = frozenset(skip_dirnames)
 
         self._stop_event = threading.Event()
         self._thread = None
 
-        self._dir_queue = queue.Queue()
-        self._dir_queue.put(root)
+        # Shared by all workers. Everything below is guarded by self._cond.
+        self._cond = threading.Condition()
+        # Used as a LIFO stack (DFS): pending dirs stay ~O(depth) instead of a whole tree level
+        # Items are (path, real_parent) - see _scan_dir
+        self._dir_queue = deque([(root, None)])
+        self._active = 0  # directories currently being listed by a worker
+        self._dirs_since_update = 0
+        self._update_seq = 0
 
         self.scanned_dirs = 0
         self.scanned_files = 0
 
-        self.dir_sizes = {}  # direct files only
-        self.top_files: List[Tuple[str, int]] = []
+        # Min-heaps of (size, path) holding the largest files / directories seen so far.
+        # The smallest of the top items sits at [0], so most items only cost one compare.
+        # Directory sizes count direct files only, and each directory is pushed once
+        # after its scandir loop finishes.
+        self._top_heap: List[Tuple[int, str]] = []
+        self._dir_heap: List[Tuple[int, str]] = []
+        self._update_top_files = _make_top_pusher(self._top_heap, max_results)
+        self._update_top_dirs = _make_top_pusher(self._dir_heap, max_results)
 
         # NEW: prevent loops by tracking real paths we've already scanned
         self._visited_realpaths = set()
 
+        # Snapshots are taken under _cond but formatted/sent after it is released,
+        # so two workers' updates can finish in either order. _emit_lock plus the
+        # last sent seq make on_update only ever see newer snapshots.
+        self._emit_lock = threading.Lock()
+        self._emitted_seq = 0
+
     def start(self):
-        self._thread = threading.Thread(target=self._run, daemon=True)
+        """Run the scan on a background thread (see run())."""
+        self._thread = threading.Thread(target=self.run, daemon=True)
         self._thread.start()
 
     def stop(self):
         self._stop_event.set()
+        # Wake any worker waiting for more directories
+        with self._cond:
+            self._cond.notify_all()
 
-    def _update_top_files(self, file_path: str, size: int):
-        self.top_files.append((file_path, size))
-        self.top_files.sort(key=lambda x: x[1], reverse=True)
-        if len(self.top_files) > self.max_results:
-            self.top_files = self.top_files[: self.max_results]
+    @staticmethod
+    def _sorted_top(heap: List[Tuple[int, str]]) -> List[Tuple[str, int]]:
+        # Only sorted when the UI asks for an update, not per item
+        return [(path, size) for size, path in sorted(heap, reverse=True)]
 
-    def _get_top_dirs(self) -> List[Tuple[str, int]]:
-        items = list(self.dir_sizes.items())
-        items.sort(key=lambda x: x[1], reverse=True)
-        return items[: self.max_results]
+    def _get_top_files(self) -> List[Tuple[str, int]]:
+        return self._sorted_top(self._top_heap)
 
-    def _send_update(self, current_dir: str):
-        self.on_update(
-            ScanUpdate(
-                current_dir=current_dir,
-                scanned_dirs=self.scanned_dirs,
-                scanned_files=self.scanned_files,
-                top_dirs=self._get_top_dirs(),
-                top_files=list(self.top_files),
-            )
+    def _get_top_dirs(self) -> List[Tuple[str, int]]:
+        return self._sorted_top(self._dir_heap)
+
+    def _make_update(self, current_dir: str) -> ScanUpdate:
+        # Caller must hold self._cond so the snapshot is consistent
+        self._update_seq += 1
+        return ScanUpdate(
+            seq=self._update_seq,
+            current_dir=current_dir,
+            scanned_dirs=self.scanned_dirs,
+            scanned_files=self.scanned_files,
+            top_dirs=self._get_top_dirs(),
+            top_files=self._get_top_files(),
         )
 
-    def _run(self):
-        dirs_since_update = 0
+    def _emit(self, update: ScanUpdate):
+        """
+        Format the display rows (outside the lock) and hand the update to on_update,
+        unless a newer snapshot was already sent (then this one is stale and dropped).
+        """
+        update.top_dirs_display = [format_row(path, size) for path, size in update.top_dirs]
+        update.top_files_display = [format_row(path, size) for path, size in update.top_files]
+        with self._emit_lock:
+            if update.seq <= self._emitted_seq:
+                return
+            self._emitted_seq = update.seq
+            self.on_update(update)
 
-        while not self._dir_queue.empty() and not self._stop_event.is_set():
-            current_dir = self._dir_queue.get()
-
-            # NEW: resolve real path and skip if already visited (prevents loops)
+    def _send_update(self, current_dir: str):
+        with self._cond:
+            update = self._make_update(current_dir)
+        self._emit(update)
+
+    def run(self):
+        """Scan in the calling thread; returns after on_done has been called."""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = [pool.submit(self._worker) for _ in range(self.max_workers)]
+            for fut in futures:
+                # A worker that died would leave its share of the tree unscanned:
+                # stop the others too, and report the failure below
+                fut.add_done_callback(lambda f: f.exception() is not None and self.stop())
+
+        error = next((f.exception() for f in futures if f.exception() is not None), None)
+        try:
+            self._send_update(current_dir="(done)")
+        except Exception as e:
+            error = error or e
+
+        if error is not None:
+            self.on_done(f"Scan failed: {error}")
+        else:
+            self.on_done("Scan stopped." if self._stop_event.is_set() else "Scan finished.")
+
+    def _next_dir(self) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        Block until a directory is available and claim it.
+        Returns None when the scan is stopped, or when the queue is empty
+        and no other worker is still listing (so nothing new can appear).
+        """
+        cond = self._cond
+        stop_is_set = self._stop_event.is_set
+        with cond:
+            while not self._dir_queue and self._active and not stop_is_set():
+                cond.wait()
+            if stop_is_set() or not self._dir_queue:
+                cond.notify_all()
+                return None
+            self._active += 1
+            return self._dir_queue.pop()
+
+    def _worker(self):
+        while True:
+            item = self._next_dir()
+            if item is None:
+                return
+            current_dir, real_parent = item
+
+            subdirs: List[Tuple[str, Optional[str]]] = []
+            files: List[Tuple[int, str]] = []
+            dir_total = 0
+            scanned = False
             try:
-                real = os.path.realpath(current_dir)
-            except Exception:
-                real = current_dir
+                # NEW: resolve real path and skip if already visited (prevents loops)
+                # Plain subdirectories inherit their parent's real path; only the root
+                # and symlinks/junctions need a realpath() call.
+                if real_parent is not None:
+                    real = os.path.join(real_parent, os.path.basename(current_dir))
+                else:
+                    try:
+                        real = os.path.realpath(current_dir)
+                    except Exception:
+                        real = current_dir
+
+                with self._cond:
+                    if real not in self._visited_realpaths:
+                        self._visited_realpaths.add(real)
+                        scanned = True
+
+                if scanned:
+                    dir_total = _scan_dir(
+                        current_dir, real, subdirs, files, self._stop_event.is_set, self.skip_dirnames
+                    )
+            finally:
+                update = self._finish_dir(current_dir, scanned, subdirs, files, dir_total)
+
+            if update is not None:
+                self._emit(update)
+
+    def _finish_dir(
+        self,
+        current_dir: str,
+        scanned: bool,
+        subdirs: List[Tuple[str, Optional[str]]],
+        files: List[Tuple[int, str]],
+        dir_total: int,
+    ) -> Optional[ScanUpdate]:
+        """
+        Merge one worker's results into the shared state.
+        Returns an update snapshot when it's time to notify the UI.
+        """
+        update = None
+        with self._cond:
+            self._active -= 1
+            if subdirs:
+                self._dir_queue.extend(subdirs)
+
+            if scanned:
+                self.scanned_dirs += 1
+                self.scanned_files += len(files)
+                update_top = self._update_top_files
+                for size, path in files:
+                    update_top(path, size)
+                self._update_top_dirs(current_dir, dir_total)
+
+                self._dirs_since_update += 1
+                if self._dirs_since_update >= self.update_every_dirs:
+                    self._dirs_since_update = 0
+                    update = self._make_update(current_dir)
+
+            # Wake waiters if there is new work, or if the scan may now be complete
+            if subdirs or not self._active:
+                self._cond.notify_all()
+        return update
+
+
+def _scan_in_process(root: str, out_q, stop_event, scanner_kwargs: dict):
+    """
+    Child process entry point for ProcessDirectoryScanner.
+    Runs a normal DirectoryScanner and forwards its callbacks over `out_q`
+    as ("update", ScanUpdate) / ("done", msg) messages.
+    """
+    scanner = DirectoryScanner(
+        root=root,
+        on_update=lambda update: out_q.put(("update", update)),
+        on_done=lambda msg: out_q.put(("done", msg)),
+        **scanner_kwargs,
+    )
+
+    def relay_stop():
+        stop_event.wait()
+        scanner.stop()
+
+    threading.Thread(target=relay_stop, daemon=True).start()
+    scanner.run()
+
+
+class ProcessDirectoryScanner:
+    """
+    Same interface as DirectoryScanner, but the scan runs in a child process.
+    The workers' Python-level loop (scandir entries, heaps, row formatting) then
+    no longer competes with the Tk thread for the GIL. A relay thread in this
+    process receives the messages and calls on_update/on_done, so callers can't
+    tell the two apart.
+    """
 
-            if real in self._visited_realpaths:
-                continue
-            self._visited_realpaths.add(real)
+    def __init__(
+        self,
+        root: str,
+        on_update: Callable[[ScanUpdate], None],
+        on_done: Callable[[str], None],
+        **scanner_kwargs,
+    ):
+        self.root = root
+        self.on_update = on_update
+        self.on_done = on_done
+        self._scanner_kwargs = scanner_kwargs
+
+        # "spawn" everywhere: forking a process that already runs Tk and threads is unsafe
+        ctx = multiprocessing.get_context("spawn")
+        self._queue = ctx.Queue()
+        self._stop_event = ctx.Event()
+        self._process = ctx.Process(
+            target=_scan_in_process,
+            args=(root, self._queue, self._stop_event, scanner_kwargs),
+            daemon=True,
+        )
+        self._thread = None
 
-            self.scanned_dirs += 1
-            dirs_since_update += 1
+    def start(self):
+        self._process.start()
+        self._thread = threading.Thread(target=self._relay, daemon=True)
+        self._thread.start()
 
-            if current_dir not in self.dir_sizes:
-                self.dir_sizes[current_dir] = 0
+    def stop(self):
+        self._stop_event.set()
 
+    def _relay(self):
+        while True:
             try:
-                with os.scandir(current_dir) as it:
-                    for entry in it:
-                        if self._stop_event.is_set():
-                            break
-
-                        # IMPORTANT CHANGE:
-                        # We do NOT blanket-skip symlinks anymore,
-                        # because Documents/OneDrive folders can be junctions.
-                        # Instead we allow directories and rely on visited_realpaths to prevent loops.
-
-                        # Queue subdirectories (including junctions)
-                        try:
-                            if entry.is_dir(follow_symlinks=True):
-                                self._dir_queue.put(entry.path)
-                                continue
-                        except Exception:
-                            continue
-
-                        # Process files (follow_symlinks=False is fine)
-                        try:
-                            if entry.is_file(follow_symlinks=False):
-                                size = entry.stat().st_size
-                                self.scanned_files += 1
-                                self.dir_sizes[current_dir] += size
-                                self._update_top_files(entry.path, size)
-                        except Exception:
-                            continue
-
-            except Exception:
-                # Permission denied / inaccessible
-                pass
-
-            if dirs_since_update >= self.update_every_dirs:
-                dirs_since_update = 0
-                self._send_update(current_dir=current_dir)
-
-        self._send_update(current_dir="(done)")
-        self.on_done("Scan stopped." if self._stop_event.is_set() else "Scan finished.")
+                kind, payload = self._queue.get(timeout=0.25)
+            except queue.Empty:
+                if self._process.is_alive():
+                    continue
+                # The child has exited. Whatever it sent first is already in the pipe
+                # (its queue is flushed on exit), so read that before deciding it crashed.
+                try:
+                    kind, payload = self._queue.get_nowait()
+                except queue.Empty:
+                    # Died without saying "done" (crash / killed / failed to start)
+                    self._process.join(timeout=1.0)
+                    self.on_done(f"Scan failed (scanner process exited with code {self._process.exitcode}).")
+                    return
+
+            if kind == "update":
+                self.on_update(payload)
+            else:
+                self._process.join(timeout=1.0)
+                self.on_done(payload)
+                return
@@ -21,30 +21,65 @@ import os
 import math
 import subprocess
 import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import tkinter as tk
 from tkinter import ttk, messagebox
+from tkinter import font as tkfont
 
 # send2trash safely sends files to the OS Recycle Bin instead of deleting permanently
 from send2trash import send2trash  # pip install send2trash
-from PIL import Image, ImageTk
 
 from filesystem_sources import get_scan_roots
-from scanner_thread import DirectoryScanner, format_size
+from scanner_thread import DirectoryScanner, ProcessDirectoryScanner
 from open_utils import open_file, open_folder, reveal_in_folder
 
-def resource_path(relative_path: str) -> str:
-    """
-    Returns a usable absolute path to bundled resources.
+# Run the scan in a child process (so it never competes with the UI for the GIL).
+# False = the plain threaded scanner, which is also the fallback if the process can't start.
+# Off until the process path has been tested in the PyInstaller build.
+SCAN_IN_PROCESS = False
+
+# How often (ms) the UI picks up scanner progress (~20Hz)
+UPDATE_POLL_MS = 50
+
+# Status labels (current dir, counts) are rewritten at most this often (~15Hz);
+# nobody reads paths faster, and each change re-lays out the label
+LABEL_UPDATE_INTERVAL = 1.0 / 15.0
+
+# Tk event.state bits for Shift / Control (used for multi-select clicks)
+SELECT_MODIFIER_MASK = 0x0001 | 0x0004
+
+# Drag hover visuals are refreshed at most this often (~60Hz),
+# and only once the cursor moved at least DRAG_VISUALS_MIN_MOVE pixels (|dx| + |dy|)
+DRAG_VISUALS_INTERVAL = 1.0 / 60.0
+DRAG_VISUALS_MIN_MOVE = 3
+
+# Multi-file Recycle Bin confirm lists at most this many file names
+CONFIRM_MAX_NAMES = 8
+
+# Listboxes only render this many result rows at first; scrolling to the bottom
+# renders the next chunk. Keeps updates O(visible rows) when Max results is large.
+RENDER_CHUNK = 60
 
-    - In VS Code / normal python runs: uses your project folder
-    - In PyInstaller onefile exe: uses the temporary _MEIPASS folder
-    """
-    try:
-        base_path = sys._MEIPASS  # type: ignore[attr-defined]
-    except Exception:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
+# Estimated progress curve 95 * (1 - e^(-dirs / 2500)), precomputed in steps of
+# PROGRESS_STEP dirs; past the end of the table the curve is flat (~94.9%) anyway
+PROGRESS_STEP = 16
+_PROGRESS_LUT = tuple(95.0 * (1.0 - math.exp(-i * PROGRESS_STEP / 2500.0)) for i in range(1024))
+
+
+IS_WINDOWS = sys.platform.startswith("win")
+
+# Where bundled resources live (resolved once at import):
+# - In VS Code / normal python runs: uses your project folder
+# - In PyInstaller onefile exe: uses the temporary _MEIPASS folder
+_BASE_PATH = getattr(sys, "_MEIPASS", os.path.abspath("."))
+
+
+def resource_path(relative_path: str) -> str:
+    """Returns a usable absolute path to bundled resources."""
+    return os.path.join(_BASE_PATH, relative_path)
 
 
 
@@ -67,26 +102,63 @@ class StorageScannerApp(tk.Tk):
         # Will hold our DirectoryScanner instance while scanning is active
         self.scanner = None
 
+        # Scanner threads drop updates into this one-slot buffer (no Tk calls from workers);
+        # a newer update replaces an unapplied one. The main loop polls it every UPDATE_POLL_MS.
+        self._update_q = deque(maxlen=1)
+        self._poll_job = None
+        self._last_label_update = 0.0
+        self._last_update = None  # newest update applied (its labels may have been throttled)
+
         # These arrays map Listbox row index -> real path string.
         # Example: if you click row 0 in file_list, file_path = self._file_paths[0].
         self._dir_paths = [] 
         self._file_paths = []
 
+        # Root of the last scan that ran to the end (or was stopped); re-scanning
+        # the same root keeps its rows visible until the new results replace them
+        self._last_scanned_root = None
+
+        # Row text for ALL results, and how many of them each Listbox renders
+        self._dir_rows = []
+        self._file_rows = []
+        self._dir_render_limit = RENDER_CHUNK
+        self._file_render_limit = RENDER_CHUNK
+
+        # Row text currently shown in each Listbox (so updates only patch changed rows)
+        self._last_dir_rows = []
+        self._last_file_rows = []
+
+        # (path, size) results of the last applied update, to skip unchanged lists
+        self._last_top_dirs = ()
+        self._last_top_files = ()
+
         # ---------------- Drag-drop state (FILES ONLY) ----------------
         # When user clicks and moves mouse enough, we treat it as a drag.
         self._dragging = False              # True when drag actually started
-        self._drag_index = None             # Which file row is being dragged
+        self._drag_index = None             # Which file row the mouse went down on
+        self._drag_indices = []             # All selected file rows being dragged (highest first)
+        self._drag_paths = []               # Their paths, captured when the drag starts
+        self._drag_modified = False         # Shift/Ctrl click (selection edit, not open/drag)
         self._drag_start_x = 0              # Where mouse down started (screen coordinates)
         self._drag_start_y = 0
-        self._drag_ghost = None             # A tiny label that follows mouse (feedback)
+        self._drag_ghost = None             # A tiny borderless window that follows mouse (feedback)
         self._drag_threshold = 6            # Pixels needed to count as a "drag" vs a click
 
-        # We use global bindings so dropping still works if the mouse leaves the listbox
-        self._global_drag_bindings_active = False
+        # send2trash runs here so a big batch doesn't freeze the Tk loop
+        self._trash_pool = ThreadPoolExecutor(max_workers=1)
 
         # Recycle bin images (two states)
         self.bin_closed_img = None
         self.bin_open_img = None
+        self._bin_is_open = False
+
+        # Bin label's screen rectangle (x1, y1, x2, y2), refreshed on <Configure>
+        # so the drag hit test doesn't ask Tk for geometry on every mouse move
+        self._bin_rect = (0, 0, -1, -1)
+        self._last_drag_visuals = 0.0
+        self._last_drag_xy = (0, 0)
+        self._drag_trailing_xy = (0, 0)     # newest throttled position, drawn by _drag_trailing_job
+        self._drag_trailing_job = None
 
         # Theme first (defines colors), then build UI
         self._apply_theme()
@@ -106,6 +178,10 @@ class StorageScannerApp(tk.Tk):
 
         self.configure(bg=self.BG)
 
+        # Named fonts are created once and shared by every style (no re-parsing font tuples)
+        self._ui_font = tkfont.Font(self, family="Segoe UI", size=10)
+        self._ui_font_bold = tkfont.Font(self, family="Segoe UI", size=10, weight="bold")
+
         style = ttk.Style(self)
 
         # Try to use "clam" because it is easiest to style consistently
@@ -115,7 +191,7 @@ class StorageScannerApp(tk.Tk):
             pass
 
         # Default styling for ttk widgets
-        style.configure(".", background=self.BG, foreground=self.TEXT, font=("Segoe UI", 10))
+        style.configure(".", background=self.BG, foreground=self.TEXT, font=self._ui_font)
         style.configure("TFrame", background=self.BG)
         style.configure("TLabel", background=self.BG, foreground=self.TEXT)
         style.configure("TLabelframe", background=self.BG, foreground=self.TEXT)
@@ -125,7 +201,7 @@ class StorageScannerApp(tk.Tk):
             "TLabelframe.Label",
             background=self.BG,
             foreground=self.MUTED,
-            font=("Segoe UI", 10, "bold")
+            font=self._ui_font_bold
         )
 
         # Buttons
@@ -200,19 +276,21 @@ class StorageScannerApp(tk.Tk):
         status.pack(fill="x", padx=12, pady=(0, 10))
 
         # Text above progress bar
-        self.progress_text = tk.StringVar(value="Not started")
-        ttk.Label(status, textvariable=self.progress_text).pack(anchor="w", padx=10, pady=(6, 2))
+        # (plain text labels, set with config(): no Tcl variable to write through)
+        self.progress_label = ttk.Label(status, text="Not started")
+        self.progress_label.pack(anchor="w", padx=10, pady=(6, 2))
 
         # Progress bar (we estimate progress since we don't know total directories)
-        self.progress_value = tk.DoubleVar(value=0.0)
+        # Its value is set directly via progress_bar["value"] (no Tcl variable in between)
         self.progress_bar = ttk.Progressbar(
             status,
-            variable=self.progress_value,
+            value=0.0,
             maximum=100.0,
             mode="determinate",
             style="Red.Horizontal.TProgressbar"
         )
         self.progress_bar.pack(fill="x", padx=10, pady=(0, 6))
+        self._progress_style = "Red.Horizontal.TProgressbar"  # style currently applied
 
       # ---------- Recycle Bin drop target (IMAGE ONLY) ----------
         # Use tk.Frame here so bg + height behave predictably
@@ -220,21 +298,27 @@ class StorageScannerApp(tk.Tk):
         bin_row.pack(fill="x", padx=10, pady=(0, 6))
         bin_row.pack_propagate(False)  # <- prevents shrinking smaller than height
 
-        closed_path = resource_path("images/ClosedRecycleBin.png")
-        open_path = resource_path("images/OpenRecycleBin.png")
-
-        # Pick a fixed on-screen size (change this)
+        # Pick a fixed on-screen size (change this, then re-run resize_bin_images.py)
         BIN_W, BIN_H = 96, 172
 
-        def load_resized_png(path: str):
-            img = Image.open(path).convert("RGBA")
+        def load_bin_png(name: str):
+            # Fast path: image pre-resized by resize_bin_images.py, Tk decodes PNG itself
+            sized_path = resource_path(f"images/{name}_{BIN_W}x{BIN_H}.png")
+            try:
+                return tk.PhotoImage(master=self, file=sized_path)
+            except tk.TclError:
+                pass
+
+            # Fallback: resize the full-size original with Pillow
+            from PIL import Image, ImageTk
+            img = Image.open(resource_path(f"images/{name}.png")).convert("RGBA")
             img = img.resize((BIN_W, BIN_H), Image.LANCZOS)  # type: ignore
             return ImageTk.PhotoImage(img)
 
 
         try:
-            self.bin_closed_img = load_resized_png(closed_path)
-            self.bin_open_img = load_resized_png(open_path)
+            self.bin_closed_img = load_bin_png("ClosedRecycleBin")
+            self.bin_open_img = load_bin_png("OpenRecycleBin")
         except Exception as e:
             # Show the real error instead of silently failing
             messagebox.showerror("Image Load Error", f"Recycle bin images failed:\n\n{e}")
@@ -248,6 +332,10 @@ class StorageScannerApp(tk.Tk):
 
         self.bin_label.pack(side="left", padx=6, pady=6)
         self.bin_label.bind("<Button-1>", self._open_recycle_bin)
+
+        # Window moved/resized or bin re-laid out -> bin screen position changed
+        self.bind("<Configure>", self._on_root_configure, add="+")
+        self.bin_label.bind("<Configure>", self._refresh_bin_rect, add="+")
         
 
         ttk.Label(
@@ -257,8 +345,8 @@ class StorageScannerApp(tk.Tk):
         ).pack(side="left", padx=12)
 
         # Current directory text while scanning
-        self.current_dir_text = tk.StringVar(value="Current dir: (not started)")
-        ttk.Label(status, textvariable=self.current_dir_text, foreground=self.MUTED).pack(anchor="w", padx=10, pady=(0, 6))
+        self.current_dir_label = ttk.Label(status, text="Current dir: (not started)", foreground=self.MUTED)
+        self.current_dir_label.pack(anchor="w", padx=10, pady=(0, 6))
 
         # Counts display
         self.counts_label = ttk.Label(status, text="Dirs scanned: 0 | Files scanned: 0")
@@ -283,7 +371,8 @@ class StorageScannerApp(tk.Tk):
             selectforeground=self.TEXT,
             highlightthickness=1,
             highlightbackground=self.BLUE,
-            relief="flat"
+            relief="flat",
+            yscrollcommand=self._on_dir_list_scrolled
         )
         self.dir_list.pack(fill="both", expand=True, padx=10, pady=10)
 
@@ -296,7 +385,9 @@ class StorageScannerApp(tk.Tk):
             selectforeground=self.TEXT,
             highlightthickness=1,
             highlightbackground=self.BLUE,
-            relief="flat"
+            relief="flat",
+            selectmode="extended",  # Shift/Ctrl-click to pick several files to drag at once
+            yscrollcommand=self._on_file_list_scrolled
         )
         self.file_list.pack(fill="both", expand=True, padx=10, pady=10)
 
@@ -305,8 +396,8 @@ class StorageScannerApp(tk.Tk):
 
         # File list uses special events because we want click AND drag on same list
         self.file_list.bind("<Button-1>", self._file_mouse_down)
-        self.file_list.bind("<B1-Motion>", self._file_mouse_drag_local)
-        self.file_list.bind("<ButtonRelease-1>", self._file_mouse_up_local)
+        self.file_list.bind("<B1-Motion>", self._file_mouse_drag)
+        self.file_list.bind("<ButtonRelease-1>", self._file_mouse_up)
 
         # Right click reveal stays separate
         self.file_list.bind("<Button-3>", self._on_file_right_click_reveal)
@@ -318,11 +409,17 @@ class StorageScannerApp(tk.Tk):
     # ---------------- Bin image switching ----------------
     def _set_bin_open(self):
         """Switch recycle bin image to OPEN when hovered (only if image exists)."""
+        if self._bin_is_open:
+            return
+        self._bin_is_open = True
         if self.bin_open_img is not None:
             self.bin_label.config(image=self.bin_open_img)
 
     def _set_bin_closed(self):
         """Switch recycle bin image to CLOSED when not hovered (only if image exists)."""
+        if not self._bin_is_open:
+            return
+        self._bin_is_open = False
         if self.bin_closed_img is not None:
             self.bin_label.config(image=self.bin_closed_img)
             
@@ -331,7 +428,7 @@ class StorageScannerApp(tk.Tk):
         Open Windows Recycle Bin in Explorer when user clicks the bin image.
         """
         try:
-            if sys.platform.startswith("win"):
+            if IS_WINDOWS:
                 subprocess.Popen(["explorer.exe", "shell:RecycleBinFolder"], shell=False)
             else:
                 messagebox.showinfo("Info", "Recycle Bin opening is only supported on Windows.")
@@ -343,24 +440,26 @@ class StorageScannerApp(tk.Tk):
     def _estimated_progress(self, scanned_dirs: int) -> float:
         """
         We don't know total directories in advance.
-        Use an exponential curve that approaches 95% as scanning continues.
-        On completion we force 100%.
+        Use an exponential curve that approaches 95% as scanning continues
+        (looked up from _PROGRESS_LUT). On completion we force 100%.
         """
-        p = 95.0 * (1.0 - math.exp(-scanned_dirs / 2500.0))
-        return max(0.0, min(95.0, p))
+        return _PROGRESS_LUT[min(max(scanned_dirs, 0) // PROGRESS_STEP, len(_PROGRESS_LUT) - 1)]
 
     def _set_progress_style(self, value: float):
-        """Change bar color based on estimated percent."""
+        """Change bar color based on estimated percent (only when the color bucket changes)."""
         if value < 33:
-            self.progress_bar.config(style="Red.Horizontal.TProgressbar")
+            name = "Red.Horizontal.TProgressbar"
         elif value < 66:
-            self.progress_bar.config(style="Yellow.Horizontal.TProgressbar")
+            name = "Yellow.Horizontal.TProgressbar"
         else:
-            self.progress_bar.config(style="Green.Horizontal.TProgressbar")
+            name = "Green.Horizontal.TProgressbar"
+        if name != self._progress_style:
+            self.progress_bar.config(style=name)
+            self._progress_style = name
 
     # ---------------- SCAN CONTROL ----------------
     def start_scan(self):
-        """Start scanning in a background thread."""
+        """Start scanning in a background process (or thread, see SCAN_IN_PROCESS)."""
         if self.scanner is not None:
             messagebox.showinfo("Info", "Already scanning.")
             return
@@ -378,31 +477,52 @@ class StorageScannerApp(tk.Tk):
         except ValueError:
             max_results = 25
 
-        # Clear UI lists + maps
-        self.dir_list.delete(0, tk.END)
-        self.file_list.delete(0, tk.END)
-        self._dir_paths = []
-        self._file_paths = []
+        # Clear UI lists + maps (unless re-scanning the same root: then the old rows
+        # stay as stale-but-visible and the diffed updates replace them in place)
+        if root != self._last_scanned_root:
+            self.dir_list.delete(0, tk.END)
+            self.file_list.delete(0, tk.END)
+            self._dir_paths = []
+            self._file_paths = []
+            self._dir_rows = []
+            self._file_rows = []
+            self._dir_render_limit = RENDER_CHUNK
+            self._file_render_limit = RENDER_CHUNK
+            self._last_dir_rows = []
+            self._last_file_rows = []
+            self._last_top_dirs = ()
+            self._last_top_files = ()
 
         # Reset progress UI
-        self.progress_value.set(0.0)
-        self.progress_text.set("Scanning...")
-        self.current_dir_text.set("Current dir: (starting...)")
+        self._last_update = None
+        self.progress_bar["value"] = 0.0
+        self.progress_label.config(text="Scanning...")
+        self.current_dir_label.config(text="Current dir: (starting...)")
         self._set_progress_style(0.0)
         self.bottom_label.config(text="Starting scan...")
 
         self.start_btn.config(state="disabled")
         self.stop_btn.config(state="normal")
 
-        # Create scanner thread object
-        self.scanner = DirectoryScanner(
+        # Create scanner object (both kinds call back from a background thread)
+        scanner_args = dict(
             root=root,
             max_results=max_results,
             update_every_dirs=25,
             on_update=self._on_scan_update_threadsafe,
             on_done=self._on_scan_done_threadsafe,
         )
-        self.scanner.start()
+        self.scanner = None
+        if SCAN_IN_PROCESS:
+            try:
+                self.scanner = ProcessDirectoryScanner(**scanner_args)
+                self.scanner.start()
+            except (OSError, RuntimeError):
+                self.scanner = None
+        if self.scanner is None:
+            self.scanner = DirectoryScanner(**scanner_args)
+            self.scanner.start()
+        self._poll_job = self.after(UPDATE_POLL_MS, self._poll_updates)
 
     def stop_scan(self):
         """Ask scanner thread to stop."""
@@ -412,44 +532,146 @@ class StorageScannerApp(tk.Tk):
 
     # Thread-safe wrappers: scanner thread calls these, but UI must update on main thread
     def _on_scan_update_threadsafe(self, update):
-        self.after(0, lambda: self._apply_update(update))
+        self._update_q.append(update)
+
+    def _flush_updates(self):
+        """Apply the newest pending update, if any (older ones were already dropped)."""
+        try:
+            update = self._update_q.pop()
+        except IndexError:
+            return
+        self._apply_update(update)
+
+    def _poll_updates(self):
+        """
+        Timer on the Tk loop: apply pending scanner updates while a scan is running.
+        - While a file drag is in progress, updates wait (rows must not move under the drag).
+        - If applying an update was slow, the next poll backs off so redraws never
+          take more than ~1/4 of the main thread, whatever the scan rate.
+        """
+        self._poll_job = None
+        delay = UPDATE_POLL_MS
+        if not self._dragging:
+            started = time.monotonic()
+            self._flush_updates()
+            elapsed_ms = (time.monotonic() - started) * 1000.0
+            delay = max(UPDATE_POLL_MS, int(elapsed_ms * 4))
+        if self.scanner is not None:
+            self._poll_job = self.after(delay, self._poll_updates)
 
     def _on_scan_done_threadsafe(self, msg: str):
-        self.after(0, lambda: self._scan_done(msg))
+        self.after(0, self._scan_done, msg)
 
     # ---------------- UI updates (main thread) ----------------
     def _apply_update(self, update):
         """Apply scanner updates to UI."""
-        self.current_dir_text.set(f"Current dir: {update.current_dir}")
-        self.counts_label.config(text=f"Dirs scanned: {update.scanned_dirs} | Files scanned: {update.scanned_files}")
+        self._last_update = update
+        now = time.monotonic()
+        if now - self._last_label_update >= LABEL_UPDATE_INTERVAL:
+            self._last_label_update = now
+            self.current_dir_label.config(text=f"Current dir: {update.current_dir}")
+            self.counts_label.config(text=f"Dirs scanned: {update.scanned_dirs} | Files scanned: {update.scanned_files}")
 
         est = self._estimated_progress(update.scanned_dirs)
-        self.progress_value.set(est)
+        self.progress_bar["value"] = est
         self._set_progress_style(est)
-        self.progress_text.set("Scanning...")
 
-        # Directories list and map
-        self.dir_list.delete(0, tk.END)
-        self._dir_paths = []
-        for path, size in update.top_dirs:
-            self.dir_list.insert(tk.END, f"{format_size(size)}  |  {path}")
-            self._dir_paths.append(path)
+        # Directories list and map (skipped when the top-N is unchanged since last tick)
+        top_dirs = tuple(update.top_dirs)
+        if top_dirs != self._last_top_dirs:
+            self._last_top_dirs = top_dirs
+            self._dir_rows = update.top_dirs_display
+            self._dir_paths = [path for path, _size in top_dirs]
+            self._render_dir_rows()
 
         # Files list and map
-        self.file_list.delete(0, tk.END)
-        self._file_paths = []
-        for path, size in update.top_files:
-            self.file_list.insert(tk.END, f"{format_size(size)}  |  {path}")
-            self._file_paths.append(path)
+        top_files = tuple(update.top_files)
+        if top_files != self._last_top_files:
+            self._last_top_files = top_files
+            self._file_rows = update.top_files_display
+            self._file_paths = [path for path, _size in top_files]
+            self._render_file_rows()
+
+    # Rendered rows are always a prefix of the results, so Listbox row i is still result i
+    def _render_dir_rows(self):
+        rows = self._dir_rows[: self._dir_render_limit]
+        self._patch_listbox(self.dir_list, self._last_dir_rows, rows)
+        self._last_dir_rows = rows
+
+    def _render_file_rows(self):
+        rows = self._file_rows[: self._file_render_limit]
+        self._patch_listbox(self.file_list, self._last_file_rows, rows)
+        self._last_file_rows = rows
+
+    def _on_dir_list_scrolled(self, _first, last):
+        """yscrollcommand: render the next chunk once the bottom row comes into view."""
+        if float(last) >= 1.0 and len(self._dir_rows) > self._dir_render_limit:
+            self._dir_render_limit += RENDER_CHUNK
+            self.after_idle(self._render_dir_rows)
+
+    def _on_file_list_scrolled(self, _first, last):
+        """yscrollcommand: render the next chunk once the bottom row comes into view."""
+        if float(last) >= 1.0 and len(self._file_rows) > self._file_render_limit:
+            self._file_render_limit += RENDER_CHUNK
+            self.after_idle(self._render_file_rows)
+
+    def _patch_listbox(self, listbox: tk.Listbox, old_rows: list, new_rows: list):
+        """
+        Make `listbox` show `new_rows`, given it currently shows `old_rows`.
+        Rows before the first difference are left alone. The usual top-N change
+        (one new row pushed in, everything below shifts down) is a single insert.
+        Tk defers the Listbox redraw to idle time, so however many rows change the
+        list repaints once per tick; don't call update()/update_idletasks() in here.
+        """
+        n_old, n_new = len(old_rows), len(new_rows)
+
+        # Longest common prefix
+        lcp = 0
+        limit = min(n_old, n_new)
+        while lcp < limit and old_rows[lcp] == new_rows[lcp]:
+            lcp += 1
+        if lcp == n_old == n_new:
+            return
+
+        # One row inserted at lcp, the old rows shifted down by one
+        if lcp < n_new and new_rows[lcp + 1:] == old_rows[lcp:n_new - 1]:
+            listbox.insert(lcp, new_rows[lcp])
+            if n_old + 1 > n_new:
+                listbox.delete(n_new, tk.END)
+            return
+
+        # Anything else: replace the tail after the common prefix (one bulk insert)
+        if lcp < n_old:
+            listbox.delete(lcp, tk.END)
+        if lcp < n_new:
+            listbox.insert(tk.END, *new_rows[lcp:])
 
     def _scan_done(self, msg: str):
         """Called when scanner finishes or stops."""
-        self.progress_value.set(100.0)
-        self.progress_bar.config(style="Green.Horizontal.TProgressbar")
-        self.progress_text.set("Done")
-        self.current_dir_text.set("Current dir: (done)")
+        # Rows must not move under a file drag (like _poll_updates): finish after the drop
+        if self._dragging:
+            self.after(UPDATE_POLL_MS, self._scan_done, msg)
+            return
+
+        # Apply the final update now and stop polling, so a late poll can't overwrite "Done"
+        if self._poll_job is not None:
+            self.after_cancel(self._poll_job)
+            self._poll_job = None
+        self._flush_updates()
+
+        # The final update may have been applied by a poll with its labels throttled
+        # away, so write its counts here directly
+        update = self._last_update
+        if update is not None:
+            self.counts_label.config(text=f"Dirs scanned: {update.scanned_dirs} | Files scanned: {update.scanned_files}")
+
+        self.progress_bar["value"] = 100.0
+        self._set_progress_style(100.0)
+        self.progress_label.config(text="Done")
+        self.current_dir_label.config(text="Current dir: (done)")
         self.bottom_label.config(text=msg)
 
+        self._last_scanned_root = self.scanner.root if self.scanner is not None else None
         self.scanner = None
         self.start_btn.config(state="normal")
         self.stop_btn.config(state="disabled")
@@ -464,24 +686,18 @@ class StorageScannerApp(tk.Tk):
         if idx >= len(self._dir_paths):
             return
 
+        # The scanner already listed this folder, so skip the stat and just try to open it
         dir_path = self._dir_paths[idx]
-        if os.path.isdir(dir_path):
+        try:
             open_folder(dir_path)
             self.bottom_label.config(text=f"Opened folder: {dir_path}")
-        else:
+        except OSError:
             self.bottom_label.config(text="Folder not accessible or no longer exists.")
 
     # ---------------- Drag support (Files only) ----------------
-    def _start_global_drag_bindings(self):
-        """
-        Bind mouse move/release at the application level,
-        so drop detection still works even when mouse leaves file_list.
-        """
-        if self._global_drag_bindings_active:
-            return
-        self._global_drag_bindings_active = True
-        self.bind_all("<B1-Motion>", self._file_mouse_drag_global, add="+")
-        self.bind_all("<ButtonRelease-1>", self._file_mouse_up_global, add="+")
+    # While a drag is active file_list holds the pointer grab, so its own
+    # <B1-Motion>/<ButtonRelease-1> bindings see the mouse anywhere in the app
+    # (no application-wide bind_all handlers needed).
 
     def _file_mouse_down(self, event):
         """
@@ -496,23 +712,32 @@ class StorageScannerApp(tk.Tk):
             return
 
         self._drag_index = idx
+        self._drag_indices = []
+        self._drag_paths = []
         self._dragging = False
         self._drag_start_x = event.x_root
         self._drag_start_y = event.y_root
 
-        # Visually select the item
-        self.file_list.selection_clear(0, tk.END)
-        self.file_list.selection_set(idx)
+        # Shift/Ctrl click: let the Listbox's own (extended mode) bindings edit the selection
+        self._drag_modified = bool(event.state & SELECT_MODIFIER_MASK)
+        if self._drag_modified:
+            return
+
+        # Clicking inside the current selection keeps it, so several files can be dragged together
+        if idx not in self.file_list.curselection():
+            self.file_list.selection_clear(0, tk.END)
+            self.file_list.selection_set(idx)
+            self.file_list.selection_anchor(idx)
 
         # Stop default listbox handling so our behavior is consistent
         return "break"
 
-    def _file_mouse_drag_local(self, event):
+    def _file_mouse_drag(self, event):
         """
         Mouse moved while button held down on the file list.
         If moved enough -> start drag mode.
         """
-        if self._drag_index is None:
+        if self._drag_index is None or self._drag_modified:
             return
 
         dx = abs(event.x_root - self._drag_start_x)
@@ -521,27 +746,38 @@ class StorageScannerApp(tk.Tk):
         # If movement passes threshold, start dragging
         if not self._dragging and (dx >= self._drag_threshold or dy >= self._drag_threshold):
             self._dragging = True
-            self._start_global_drag_bindings()
-
-            # Create floating "ghost" label once
+            # Resolve rows to paths now, so nothing that changes the list later
+            # (a scan update, the scan finishing) can change which files get trashed.
+            # Highest row first, so deleting rows later keeps the rest valid.
+            rows = self.file_list.curselection() or (self._drag_index,)
+            self._drag_indices = sorted((i for i in rows if 0 <= i < len(self._file_paths)), reverse=True)
+            self._drag_paths = [self._file_paths[i] for i in self._drag_indices]
+            self._refresh_bin_rect()
+            self.file_list.grab_set()
+
+            # Create floating "ghost" window once, then reuse it (show/hide per drag).
+            # A separate borderless Toplevel is composited by the window manager,
+            # so moving it doesn't repaint the main window underneath.
             if self._drag_ghost is None:
-                self._drag_ghost = tk.Label(
-                    self,
+                self._drag_ghost = tk.Toplevel(self)
+                self._drag_ghost.overrideredirect(True)
+                self._drag_ghost.attributes("-topmost", True)
+                tk.Label(
+                    self._drag_ghost,
                     text="Drop on Recycle Bin",
                     bg=self.PANEL,
                     fg=self.TEXT,
                     padx=8,
                     pady=4
-                )
+                ).pack()
+            self._drag_ghost.geometry(f"+{event.x_root + 12}+{event.y_root + 12}")
+            self._drag_ghost.deiconify()
 
         if self._dragging:
             self._update_drag_visuals(event.x_root, event.y_root)
 
-    def _file_mouse_drag_global(self, event):
-        """Global drag handler: keeps hover detection working anywhere in the window."""
-        if not self._dragging:
-            return
-        self._update_drag_visuals(event.x_root, event.y_root)
+        # Don't let the Listbox's own drag-to-extend-selection run
+        return "break"
 
     def _update_drag_visuals(self, x_root, y_root):
         """
@@ -549,121 +785,197 @@ class StorageScannerApp(tk.Tk):
         - move the ghost label to follow the mouse
         - if the mouse is over the bin label, show OPEN image
         - otherwise show CLOSED image
+        Throttled to ~60Hz and to real cursor movement; the drop itself is always hit-tested exactly.
+        A throttled position is still drawn once the pointer rests (trailing update),
+        so the bin never stays CLOSED under a pointer that stopped on it.
         """
+        last_x, last_y = self._last_drag_xy
+        if (abs(x_root - last_x) + abs(y_root - last_y) < DRAG_VISUALS_MIN_MOVE
+                or time.monotonic() - self._last_drag_visuals < DRAG_VISUALS_INTERVAL):
+            self._drag_trailing_xy = (x_root, y_root)
+            if self._drag_trailing_job is None:
+                self._drag_trailing_job = self.after(
+                    int(DRAG_VISUALS_INTERVAL * 1000), self._draw_trailing_drag_visuals
+                )
+            return
+        self._draw_drag_visuals(x_root, y_root)
+
+    def _draw_trailing_drag_visuals(self):
+        self._drag_trailing_job = None
+        if self._dragging:
+            self._draw_drag_visuals(*self._drag_trailing_xy)
+
+    def _draw_drag_visuals(self, x_root, y_root):
+        """Unthrottled part of _update_drag_visuals (supersedes any pending trailing update)."""
+        if self._drag_trailing_job is not None:
+            self.after_cancel(self._drag_trailing_job)
+            self._drag_trailing_job = None
+        self._last_drag_visuals = time.monotonic()
+        self._last_drag_xy = (x_root, y_root)
+
         if self._drag_ghost is not None:
-            # Convert screen coords to window coords
-            self._drag_ghost.place(
-                x=x_root - self.winfo_rootx() + 12,
-                y=y_root - self.winfo_rooty() + 12
-            )
+            # Ghost is its own window, so it's positioned in screen coordinates
+            self._drag_ghost.geometry(f"+{x_root + 12}+{y_root + 12}")
 
-        if self._is_over_widget(x_root, y_root, self.bin_label):
+        if self._is_over_bin(x_root, y_root):
             self._set_bin_open()
         else:
             self._set_bin_closed()
 
-    def _file_mouse_up_local(self, event):
+    def _file_mouse_up(self, event):
         """
-        Mouse released inside file_list.
+        Mouse released (anywhere, thanks to the grab).
         If we were NOT dragging, treat this as a normal click -> open file.
-        If we WERE dragging, global release handles the drop action.
+        If we WERE dragging, handle the drop.
         """
         if self._drag_index is None:
             return
 
-        if not self._dragging:
-            idx = self._drag_index
+        if self._dragging:
+            self._file_drop(event)
+            return
+
+        if self._drag_modified:
+            # Selection edit only - don't open anything
             self._drag_index = None
+            return
 
-            if 0 <= idx < len(self._file_paths):
-                file_path = self._file_paths[idx]
-                if os.path.isfile(file_path):
-                    open_file(file_path)
-                    self.bottom_label.config(text=f"Opened file: {file_path}")
-                else:
-                    self.bottom_label.config(text="File not accessible or no longer exists.")
+        idx = self._drag_index
+        self._drag_index = None
+
+        # A plain click collapses any multi-selection to the clicked row
+        self.file_list.selection_clear(0, tk.END)
+        self.file_list.selection_set(idx)
+
+        if 0 <= idx < len(self._file_paths):
+            # The scanner already stat'ed this file, so skip the check and just try to open it
+            file_path = self._file_paths[idx]
+            try:
+                open_file(file_path)
+                self.bottom_label.config(text=f"Opened file: {file_path}")
+            except OSError:
+                self.bottom_label.config(text="File not accessible or no longer exists.")
 
-    def _file_mouse_up_global(self, event):
+    def _file_drop(self, event):
         """
-        Mouse released anywhere.
-        If dragging AND released over the bin:
-            -> confirm -> send2trash -> remove from list
-        Always resets bin to CLOSED and hides ghost.
+        Drag ended.
+        If released over the bin:
+            -> confirm once -> send2trash(all dragged files in one call) -> remove from list
+        Always resets bin to CLOSED, hides ghost and releases the grab.
         """
-        if self._drag_index is None:
-            return
-
-        idx = self._drag_index
-        was_dragging = self._dragging
+        indices = self._drag_indices
+        paths = self._drag_paths
 
         # Reset visuals now
+        self.file_list.grab_release()
         self._set_bin_closed()
         if self._drag_ghost is not None:
-            self._drag_ghost.place_forget()
+            self._drag_ghost.withdraw()
 
         # Reset drag state
         self._drag_index = None
+        self._drag_indices = []
+        self._drag_paths = []
         self._dragging = False
 
-        # If it wasn't a drag, do nothing here (local handler already opened file)
-        if not was_dragging:
+        # Only act if dropped on bin
+        if not self._is_over_bin(event.x_root, event.y_root):
             return
 
-        # Validate index
-        if idx < 0 or idx >= len(self._file_paths):
+        # Rows are files by construction; a stale one is reported when send2trash fails
+        if not paths:
             return
 
-        file_path = self._file_paths[idx]
+        if len(paths) == 1:
+            question = f"Move this file to Recycle Bin?\n\n{paths[0]}"
+        else:
+            # Name the files, so the user can check what was picked up
+            names = "\n".join(os.path.basename(p) for p in paths[:CONFIRM_MAX_NAMES])
+            if len(paths) > CONFIRM_MAX_NAMES:
+                names += f"\n... and {len(paths) - CONFIRM_MAX_NAMES} more"
+            question = f"Move these {len(paths)} files to Recycle Bin?\n\n{names}"
+        if not messagebox.askyesno("Send to Recycle Bin", question):
+            return
 
-        # Only act if dropped on bin
-        if self._is_over_widget(event.x_root, event.y_root, self.bin_label):
-            if not os.path.isfile(file_path):
-                self.bottom_label.config(text="That item is not a file.")
-                return
+        # One call for all files: send2trash batches them into a single OS operation.
+        # It runs on the trash worker; the result comes back on the Tk thread.
+        self.bottom_label.config(text=f"Sending {len(paths)} file(s) to Recycle Bin...")
+        fut = self._trash_pool.submit(send2trash, paths)
+        fut.add_done_callback(lambda f: self.after(0, self._on_trash_done, f, paths, indices))
 
-            confirm = messagebox.askyesno(
-                "Send to Recycle Bin",
-                f"Move this file to Recycle Bin?\n\n{file_path}"
-            )
-            if not confirm:
-                return
+    def _on_trash_done(self, fut, paths: list, indices: list):
+        """Runs on the Tk thread once send2trash finished (or failed)."""
+        try:
+            fut.result()
+        except Exception as e:
+            if isinstance(e, OSError):
+                self.bottom_label.config(text="File not accessible or no longer exists.")
+            else:
+                self.bottom_label.config(text="")
+            messagebox.showerror("Error", f"Could not send to Recycle Bin.\n\n{e}")
+            return
 
-            try:
-                send2trash(file_path)
-                self.bottom_label.config(text=f"Sent to Recycle Bin: {file_path}")
+        if len(paths) == 1:
+            self.bottom_label.config(text=f"Sent to Recycle Bin: {paths[0]}")
+        else:
+            self.bottom_label.config(text=f"Sent {len(paths)} files to Recycle Bin.")
 
-                # Remove from UI list immediately
-                try:
-                    current_idx = self._file_paths.index(file_path)
-                    self.file_list.delete(current_idx)
-                    del self._file_paths[current_idx]
-                except ValueError:
-                    pass
+        # Remove from UI list. Usually the rows are still where they were dragged from
+        # (indices are highest first), so delete them directly; if a scan update moved
+        # rows meanwhile, fall back to finding them by path.
+        if all(i < len(self._file_paths) and self._file_paths[i] == p for i, p in zip(indices, paths)):
+            rows_to_delete = indices
+        else:
+            trashed = set(paths)
+            rows_to_delete = [i for i in reversed(range(len(self._file_paths))) if self._file_paths[i] in trashed]
+        for i in rows_to_delete:
+            if i < len(self._last_file_rows):
+                self.file_list.delete(i)
+                del self._last_file_rows[i]
+            del self._file_paths[i]
+            del self._file_rows[i]
+
+        # Refill the render window from the rows that were below it
+        self._render_file_rows()
+
+    def _on_root_configure(self, event):
+        """
+        <Configure> bound on the root window is also in every child widget's bindtags,
+        so label/list re-layouts land here too; only the window itself moving matters.
+        """
+        if event.widget is self:
+            self._refresh_bin_rect()
 
-            except Exception as e:
-                messagebox.showerror("Error", f"Could not send to Recycle Bin.\n\n{e}")
+    def _refresh_bin_rect(self, _event=None):
+        """Cache the bin label's SCREEN rectangle (only changes on move/resize)."""
+        wx = self.bin_label.winfo_rootx()
+        wy = self.bin_label.winfo_rooty()
+        self._bin_rect = (wx, wy, wx + self.bin_label.winfo_width(), wy + self.bin_label.winfo_height())
 
-    def _is_over_widget(self, x_root: int, y_root: int, widget: tk.Widget) -> bool:
+    def _is_over_bin(self, x_root: int, y_root: int) -> bool:
         """
-        Returns True if a SCREEN coordinate is inside the widget rectangle.
+        Returns True if a SCREEN coordinate is inside the recycle bin rectangle.
         This is how we know if the mouse is 'over the recycle bin'.
         """
-        wx = widget.winfo_rootx()
-        wy = widget.winfo_rooty()
-        ww = widget.winfo_width()
-        wh = widget.winfo_height()
-        return (wx <= x_root <= wx + ww) and (wy <= y_root <= wy + wh)
+        x1, y1, x2, y2 = self._bin_rect
+        return x1 <= x_root <= x2 and y1 <= y_root <= y2
 
     # ---------------- Right-click reveal ----------------
     def _on_file_right_click_reveal(self, event):
         """Right click -> reveal file in Explorer (selects it)."""
-        idx = self.file_list.nearest(event.y)
-        if idx < 0 or idx >= len(self._file_paths):
+        # One Tcl call for the row under the pointer. An empty Listbox gives -1
+        # (which would wrap around to the last path), a row past the results fails the lookup.
+        try:
+            idx = self.file_list.index(f"@{event.x},{event.y}")
+            if idx < 0:
+                return
+            file_path = self._file_paths[idx]
+        except (tk.TclError, IndexError, TypeError):
             return
 
-        file_path = self._file_paths[idx]
-        if os.path.isfile(file_path):
+        # No stat first: reveal optimistically and report a stale entry from the error
+        try:
             reveal_in_folder(file_path)
             self.bottom_label.config(text=f"Revealed in folder: {file_path}")
-        else:
+        except OSError:
             self.bottom_label.config(text="File not accessible or no longer exists.")